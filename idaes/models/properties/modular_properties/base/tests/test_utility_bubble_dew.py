@@ -0,0 +1,166 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES).
+#
+# Copyright (c) 2018-2023 by the software owners: The Regents of the
+# University of California, through Lawrence Berkeley National Laboratory,
+# National Technology & Engineering Solutions of Sandia, LLC, Carnegie Mellon
+# University, West Virginia University Research Corporation, et al.
+# All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
+# for full copyright and license information.
+#################################################################################
+"""
+Tests for bubble and dew point estimation methods used by generic framework
+
+Author: A Lee
+"""
+import math
+
+import pytest
+
+from pyomo.environ import ConcreteModel, units as pyunits
+
+from idaes.core import declare_process_block_class
+from idaes.core import Component, LiquidPhase, VaporPhase
+from idaes.models.properties.modular_properties.base.utility import (
+    estimate_Pbub,
+    estimate_Pdew,
+    estimate_Tbub,
+    estimate_Tdew,
+)
+from idaes.models.properties.modular_properties.base.generic_property import (
+    GenericParameterData,
+)
+from idaes.models.properties.modular_properties.eos.ceos import Cubic, CubicType
+from idaes.models.properties.modular_properties.phase_equil import SmoothVLE
+from idaes.models.properties.modular_properties.phase_equil.bubble_dew import (
+    LogBubbleDew,
+)
+from idaes.models.properties.modular_properties.phase_equil.forms import log_fugacity
+from idaes.models.properties.modular_properties.pure import NIST
+from idaes.models.properties.modular_properties.state_definitions import FTPx
+
+
+# All tests in this module use the Peng-Robinson EoS
+pytestmark = pytest.mark.cubic_root
+
+
+@declare_process_block_class("DummyParameterBlock")
+class DummyParameterData(GenericParameterData):
+    def configure(self):
+        self.configured = True
+
+
+# Property configuration for pure water to use in bubble and dew point tests
+configuration = {
+    # Specifying components
+    "components": {
+        "H2O": {
+            "type": Component,
+            "pressure_sat_comp": NIST,
+            "phase_equilibrium_form": {("Vap", "Liq"): log_fugacity},
+            "parameter_data": {
+                "pressure_crit": (220.6e5, pyunits.Pa),
+                "temperature_crit": (647, pyunits.K),
+                "omega": 0.344,
+                "pressure_sat_comp_coeff": {
+                    "A": (3.55959, None),
+                    "B": (643.748, pyunits.K),
+                    "C": (-198.043, pyunits.K),
+                },
+            },
+        },
+    },
+    # Specifying phases
+    "phases": {
+        "Liq": {
+            "type": LiquidPhase,
+            "equation_of_state": Cubic,
+            "equation_of_state_options": {"type": CubicType.PR},
+        },
+        "Vap": {
+            "type": VaporPhase,
+            "equation_of_state": Cubic,
+            "equation_of_state_options": {"type": CubicType.PR},
+        },
+    },
+    # Set base units of measurement
+    "base_units": {
+        "time": pyunits.s,
+        "length": pyunits.m,
+        "mass": pyunits.kg,
+        "amount": pyunits.mol,
+        "temperature": pyunits.K,
+    },
+    # Specifying state definition
+    "state_definition": FTPx,
+    "state_bounds": {
+        "flow_mol": (0, 100, 1000, pyunits.mol / pyunits.s),
+        "temperature": (273.15, 300, 500, pyunits.K),
+        "pressure": (5e4, 1e5, 1e6, pyunits.Pa),
+    },
+    "pressure_ref": (101325, pyunits.Pa),
+    "temperature_ref": (298.15, pyunits.K),
+    # Defining phase equilibria
+    "phases_in_equilibrium": [("Vap", "Liq")],
+    "phase_equilibrium_state": {("Vap", "Liq"): SmoothVLE},
+    "bubble_dew_method": LogBubbleDew,
+    "parameter_data": {
+        "PR_kappa": {
+            ("H2O", "H2O"): 0.000,
+        }
+    },
+}
+
+
+# Constructing the model is the expensive part of these tests. The
+# temperature estimates only depend on pressure and the pressure estimates
+# only depend on temperature, so the tests can share one model.
+@pytest.fixture(scope="module")
+def model():
+    m = ConcreteModel()
+    m.params = DummyParameterBlock(
+        **configuration,
+    )
+
+    m.props = m.params.build_state_block([1], defined_state=False)
+
+    return m
+
+
+class TestBubbleDewPoints:
+    @pytest.fixture(scope="class")
+    def state_block(self, model):
+        return model.props[1]
+
+    @pytest.fixture(autouse=True)
+    def reset_state(self, state_block):
+        # Restore the state variables after each test so results do not
+        # depend on test order
+        P0 = state_block.pressure.value
+        T0 = state_block.temperature.value
+        yield
+        state_block.pressure.set_value(P0)
+        state_block.temperature.set_value(T0)
+
+    # Expected values from parameters used: 379.1828 K at atmospheric
+    # pressure and 76432.45 Pa at 100C
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "estimate, state_var, state_value, args, expected",
+        [
+            (estimate_Tbub, "pressure", 101325, (pyunits.K,), 379.1828),
+            (estimate_Tdew, "pressure", 101325, (pyunits.K,), 379.1828),
+            (estimate_Pbub, "temperature", 373.15, (), 76432.45),
+            (estimate_Pdew, "temperature", 373.15, (), 76432.45),
+        ],
+        ids=["Tbub", "Tdew", "Pbub", "Pdew"],
+    )
+    def test_bubble_dew_point(
+        self, state_block, estimate, state_var, state_value, args, expected
+    ):
+        getattr(state_block, state_var).set_value(state_value)
+        result = estimate(state_block, *args, ["H2O"], [], "Liq")
+
+        assert math.isclose(result, expected, rel_tol=1e-6)
@@ -20,8 +20,9 @@ Author: A Lee
 # pylint: disable=missing-function-docstring
 
 from enum import Enum
+import math
 
-from pyomo.environ import units as pyunits, value
+from pyomo.environ import Param, units as pyunits, value
 
 from idaes.core.util.exceptions import (
     BurntToast,
@@ -82,42 +83,7 @@ def get_method(self, config_arg, comp=None, phase=None):
     else:
         source_block = self.params.get_component(comp).config
 
-    try:
-        c_arg = getattr(source_block, config_arg)
-    except AttributeError:
-        raise AttributeError(
-            "{} Generic Property Package called for invalid "
-            "configuration option {}. Please contact the "
-            "developer of the property package.".format(self.name, config_arg)
-        )
-
-    if c_arg is None:
-        raise GenericPropertyPackageError(self, config_arg)
-
-    # Check to see if c_arg has an attribute with the name of the config_arg
-    # If so, assume c_arg is a class or module holding property subclasses
-    if hasattr(c_arg, config_arg):
-        c_arg = getattr(c_arg, config_arg)
-    if phase is not None:
-        c_arg = c_arg[phase]
-
-    # Try to get the return_expression method from c_arg
-    # Otherwise assume c_arg is the return_expression method
-    try:
-        mthd = c_arg.return_expression
-    except AttributeError:
-        mthd = c_arg
-
-    # Call the return_expression method
-    if callable(mthd):
-        return mthd
-    else:
-        raise ConfigurationError(
-            "{} Generic Property Package received invalid value "
-            "for argument {}. Value must be a method, a class with a "
-            "method named expression or a module containing one of the "
-            "previous.".format(self.name, config_arg)
-        )
+    return _get_method_from_config(self, source_block, config_arg, phase)
 
 
 def get_phase_method(self, config_arg, phase):
@@ -134,8 +100,16 @@ def get_phase_method(self, config_arg, phase):
     """
     p_config = self.params.get_phase(phase).config
 
+    return _get_method_from_config(self, p_config, config_arg)
+
+
+def _get_method_from_config(self, source_block, config_arg, phase=None):
+    """
+    Look up config_arg in a Config block and return the callable method it
+    points to. Common code for get_method and get_phase_method.
+    """
     try:
-        c_arg = getattr(p_config, config_arg)
+        c_arg = getattr(source_block, config_arg)
     except AttributeError:
         raise AttributeError(
             "{} Generic Property Package called for invalid "
@@ -148,15 +122,13 @@ def get_phase_method(self, config_arg, phase):
 
     # Check to see if c_arg has an attribute with the name of the config_arg
     # If so, assume c_arg is a class or module holding property subclasses
-    if hasattr(c_arg, config_arg):
-        c_arg = getattr(c_arg, config_arg)
+    c_arg = getattr(c_arg, config_arg, c_arg)
+    if phase is not None:
+        c_arg = c_arg[phase]
 
     # Try to get the return_expression method from c_arg
     # Otherwise assume c_arg is the return_expression method
-    try:
-        mthd = c_arg.return_expression
-    except AttributeError:
-        mthd = c_arg
+    mthd = getattr(c_arg, "return_expression", c_arg)
 
     # Check if method is callable
     if callable(mthd):
@@ -169,8 +141,6 @@ def get_phase_method(self, config_arg, phase):
             "previous.".format(self.name, config_arg)
         )
 
-    return mthd
-
 
 def get_component_object(self, comp):
     """
@@ -240,6 +210,17 @@ class ConcentrationForm(Enum):
     partialPressure = 6
 
 
+# Name of the state variable holding each form of concentration
+_CONCENTRATION_TERMS = {
+    ConcentrationForm.molarity: "conc_mol_phase_comp",
+    ConcentrationForm.activity: "act_phase_comp",
+    ConcentrationForm.molality: "molality_phase_comp",
+    ConcentrationForm.moleFraction: "mole_frac_phase_comp",
+    ConcentrationForm.massFraction: "mass_frac_phase_comp",
+    ConcentrationForm.partialPressure: "pressure_phase_comp",
+}
+
+
 def get_concentration_term(blk, r_idx, log=False):
     """
     Get necessary concentration terms for reactions from property package, allowing for
@@ -282,26 +263,17 @@ def get_concentration_term(blk, r_idx, log=False):
             "Please ensure that this argument is included in your "
             "configuration dict.".format(blk.name)
         )
-    elif conc_form == ConcentrationForm.molarity:
-        conc_term = getattr(state, pre + "conc_mol_phase_comp" + sub)
-    elif conc_form == ConcentrationForm.activity:
-        conc_term = getattr(state, pre + "act_phase_comp" + sub)
-    elif conc_form == ConcentrationForm.molality:
-        conc_term = getattr(state, pre + "molality_phase_comp" + sub)
-    elif conc_form == ConcentrationForm.moleFraction:
-        conc_term = getattr(state, pre + "mole_frac_phase_comp" + sub)
-    elif conc_form == ConcentrationForm.massFraction:
-        conc_term = getattr(state, pre + "mass_frac_phase_comp" + sub)
-    elif conc_form == ConcentrationForm.partialPressure:
-        conc_term = getattr(state, pre + "pressure_phase_comp" + sub)
-    else:
+
+    try:
+        conc_var = _CONCENTRATION_TERMS[conc_form]
+    except KeyError:
         raise BurntToast(
             "{} get_concentration_term received unrecognised "
             "ConcentrationForm ({}). This should not happen - please contact "
             "the IDAES developers with this bug.".format(blk.name, conc_form)
         )
 
-    return conc_term
+    return getattr(state, pre + conc_var + sub)
 
 
 def identify_VL_component_list(blk, phase_pair):
@@ -381,6 +353,53 @@ TOL = 1e-1
 MAX_ITER = 30
 
 
+def _vapor_pressure_expressions(
+    blk, T_units, raoult_comps, henry_comps, liquid_phase, T0
+):
+    """
+    Build expressions for the saturation pressure (Raoult's Law components) or
+    Henry's constant (Henry's Law components) of each component, and their
+    temperature derivatives, for use in the bubble and dew temperature
+    estimation loops.
+
+    The expressions are written in terms of a standalone mutable Param for
+    temperature, so that they only need to be built once and can then be
+    re-evaluated at each new temperature by updating the Param. Building the
+    expressions (including unit conversions) is much more expensive than
+    evaluating them.
+
+    Args:
+        blk: StateBlock to use
+        T_units: units of temperature
+        raoult_comps: list of components that follow Raoult's Law
+        henry_comps: list of components that follow Henry's Law
+        liquid_phase: name of liquid phase
+        T0: initial value for temperature
+
+    Returns:
+        Param for temperature, and a dict of (expression, temperature
+        derivative expression) tuples indexed by component.
+    """
+    T = Param(mutable=True, initialize=T0, units=T_units)
+    T.construct()
+
+    exprs = {}
+    for j in raoult_comps:
+        cobj = blk.params.get_component(j)
+        psat = get_method(blk, "pressure_sat_comp", j)
+        exprs[j] = (psat(blk, cobj, T), psat(blk, cobj, T, dT=True))
+    for j in henry_comps:
+        h_mthd = blk.params.get_component(j).config.henry_component[liquid_phase][
+            "method"
+        ]
+        exprs[j] = (
+            h_mthd.return_expression(blk, liquid_phase, j, T),
+            h_mthd.dT_expression(blk, liquid_phase, j, T),
+        )
+
+    return T, exprs
+
+
 def estimate_Tbub(blk, T_units, raoult_comps, henry_comps, liquid_phase):
     """
     Function to estimate bubble point temperature
@@ -406,6 +425,14 @@ def estimate_Tbub(blk, T_units, raoult_comps, henry_comps, liquid_phase):
         - 1
     )
 
+    T, p_comp = _vapor_pressure_expressions(
+        blk, T_units, raoult_comps, henry_comps, liquid_phase, Tbub0
+    )
+
+    # Pressure and composition do not change between iterations
+    P = value(blk.pressure)
+    x = {j: value(blk.mole_frac_comp[j]) for j in p_comp}
+
     err = 1
     counter = 0
 
@@ -413,47 +440,35 @@ def estimate_Tbub(blk, T_units, raoult_comps, henry_comps, liquid_phase):
     # Tolerance only needs to be ~1e-1
     # Iteration limit of 30
     while err > TOL and counter < MAX_ITER:
-        f = value(
-            sum(
-                get_method(blk, "pressure_sat_comp", j)(
-                    blk, blk.params.get_component(j), Tbub0 * T_units
-                )
-                * blk.mole_frac_comp[j]
-                for j in raoult_comps
-            )
-            + sum(
-                blk.mole_frac_comp[j]
-                * blk.params.get_component(j)
-                .config.henry_component[liquid_phase]["method"]
-                .return_expression(blk, liquid_phase, j, Tbub0 * T_units)
-                for j in henry_comps
-            )
-            - blk.pressure
-        )
-        df = value(
-            sum(
-                get_method(blk, "pressure_sat_comp", j)(
-                    blk, blk.params.get_component(j), Tbub0 * T_units, dT=True
-                )
-                * blk.mole_frac_comp[j]
-                for j in raoult_comps
-            )
-            + sum(
-                blk.mole_frac_comp[j]
-                * blk.params.get_component(j)
-                .config.henry_component[liquid_phase]["method"]
-                .dT_expression(blk, liquid_phase, j, Tbub0 * T_units)
-                for j in henry_comps
+        T.set_value(Tbub0)
+
+        # Evaluate each saturation pressure (or Henry's constant) and its
+        # temperature derivative once per iteration, and build the
+        # residual and its derivative from those values
+        sum_x_psat = 0
+        sum_x_dpsat = 0
+        for j, (p_j, dp_j) in p_comp.items():
+            sum_x_psat += x[j] * value(p_j)
+            sum_x_dpsat += x[j] * value(dp_j)
+
+        if sum_x_psat > 0:
+            # ln(Psat) is close to linear in 1/T, so take the Newton step
+            # on ln(sum(x*Psat)/P) in u = 1/T
+            u1 = 1 / Tbub0 + math.log(sum_x_psat / P) * sum_x_psat / (
+                Tbub0**2 * sum_x_dpsat
             )
-        )
+            step = Tbub0 - 1 / u1 if u1 > 0 else -float("inf")
+        else:
+            # Newton step on sum(x*Psat) - P in T
+            step = (sum_x_psat - P) / sum_x_dpsat
 
         # Limit temperature step to avoid excessive overshoot
-        if f / df < -50:
+        if step < -50:
             Tbub1 = Tbub0 + 50
-        elif f / df > 50:
+        elif step > 50:
             Tbub1 = Tbub0 - 50
         else:
-            Tbub1 = Tbub0 - f / df
+            Tbub1 = Tbub0 - step
 
         err = abs(Tbub1 - Tbub0)
         Tbub0 = Tbub1
@@ -485,6 +500,14 @@ def estimate_Tdew(blk, T_units, raoult_comps, henry_comps, liquid_phase):
         - 1
     )
 
+    T, p_comp = _vapor_pressure_expressions(
+        blk, T_units, raoult_comps, henry_comps, liquid_phase, Tdew0
+    )
+
+    # Pressure and composition do not change between iterations
+    P = value(blk.pressure)
+    y = {j: value(blk.mole_frac_comp[j]) for j in p_comp}
+
     err = 1
     counter = 0
 
@@ -492,64 +515,36 @@ def estimate_Tdew(blk, T_units, raoult_comps, henry_comps, liquid_phase):
     # Tolerance only needs to be ~1e-1
     # Iteration limit of 30
     while err > TOL and counter < MAX_ITER:
-        f = value(
-            blk.pressure
-            * (
-                sum(
-                    blk.mole_frac_comp[j]
-                    / get_method(blk, "pressure_sat_comp", j)(
-                        blk, blk.params.get_component(j), Tdew0 * T_units
-                    )
-                    for j in raoult_comps
-                )
-                + sum(
-                    blk.mole_frac_comp[j]
-                    / blk.params.get_component(j)
-                    .config.henry_component[liquid_phase]["method"]
-                    .return_expression(blk, liquid_phase, j, Tdew0 * T_units)
-                    for j in henry_comps
-                )
+        T.set_value(Tdew0)
+
+        # Evaluate each saturation pressure (or Henry's constant) and its
+        # temperature derivative once per iteration, and build the
+        # residual and its derivative from those values
+        sum_y_psat = 0
+        sum_y_dpsat = 0
+        for j, (p_j, dp_j) in p_comp.items():
+            p_val = value(p_j)
+            sum_y_psat += y[j] / p_val
+            sum_y_dpsat += y[j] / p_val**2 * value(dp_j)
+
+        if sum_y_psat > 0:
+            # ln(Psat) is close to linear in 1/T, so take the Newton step
+            # on ln(P*sum(y/Psat)) in u = 1/T
+            u1 = 1 / Tdew0 - math.log(P * sum_y_psat) * sum_y_psat / (
+                Tdew0**2 * sum_y_dpsat
             )
-            - 1
-        )
-        df = -value(
-            blk.pressure
-            * (
-                sum(
-                    blk.mole_frac_comp[j]
-                    / get_method(blk, "pressure_sat_comp", j)(
-                        blk, blk.params.get_component(j), Tdew0 * T_units
-                    )
-                    ** 2
-                    * get_method(blk, "pressure_sat_comp", j)(
-                        blk,
-                        blk.params.get_component(j),
-                        Tdew0 * T_units,
-                        dT=True,
-                    )
-                    for j in raoult_comps
-                )
-                + sum(
-                    blk.mole_frac_comp[j]
-                    / blk.params.get_component(j)
-                    .config.henry_component[liquid_phase]["method"]
-                    .return_expression(blk, liquid_phase, j, Tdew0 * T_units)
-                    ** 2
-                    * blk.params.get_component(j)
-                    .config.henry_component[liquid_phase]["method"]
-                    .dT_expression(blk, liquid_phase, j, Tdew0 * T_units)
-                    for j in henry_comps
-                )
-            )
-        )
+            step = Tdew0 - 1 / u1 if u1 > 0 else -float("inf")
+        else:
+            # Newton step on P*sum(y/Psat) - 1 in T
+            step = (1 - P * sum_y_psat) / (P * sum_y_dpsat)
 
         # Limit temperature step to avoid excessive overshoot
-        if f / df < -50:
+        if step < -50:
             Tdew1 = Tdew0 + 50
-        elif f / df > 50:
+        elif step > 50:
             Tdew1 = Tdew0 - 50
         else:
-            Tdew1 = Tdew0 - f / df
+            Tdew1 = Tdew0 - step
 
         err = abs(Tdew1 - Tdew0)
         Tdew0 = Tdew1
@@ -572,9 +567,14 @@ def estimate_Pbub(blk, raoult_comps, henry_comps, liquid_phase):
         Estimated bubble point pressure as a float.
 
     """
-    return value(
-        sum(blk.mole_frac_comp[j] * blk.pressure_sat_comp[j] for j in raoult_comps)
-        + sum(blk.mole_frac_comp[j] * blk.henry[liquid_phase, j] for j in henry_comps)
+    # Sum the values of each term directly, rather than building an expression
+    # for the sum and then evaluating it
+    return sum(
+        value(blk.mole_frac_comp[j]) * value(blk.pressure_sat_comp[j])
+        for j in raoult_comps
+    ) + sum(
+        value(blk.mole_frac_comp[j]) * value(blk.henry[liquid_phase, j])
+        for j in henry_comps
     )
 
 
@@ -592,18 +592,13 @@ def estimate_Pdew(blk, raoult_comps, henry_comps, liquid_phase):
         Estimated dew point pressure as a float.
 
     """
+    # Evaluate each Psat and Henry's constant once, as the values are needed
+    # for both the safety catch and the sum
+    p_comp = {j: value(blk.pressure_sat_comp[j]) for j in raoult_comps}
+    p_comp.update({j: value(blk.henry[liquid_phase, j]) for j in henry_comps})
+
     # Safety catch for cases where Psat or Henry's constant might be 0
     # Not sure if this is meaningful, but if this is true then mathematically Pdew = 0
-    if any(value(blk.pressure_sat_comp[j]) == 0 for j in raoult_comps) or any(
-        value(blk.henry[liquid_phase, j]) == 0 for j in henry_comps
-    ):
+    if any(p_j == 0 for p_j in p_comp.values()):
         return 0
-    return value(
-        1
-        / (
-            sum(blk.mole_frac_comp[j] / blk.pressure_sat_comp[j] for j in raoult_comps)
-            + sum(
-                blk.mole_frac_comp[j] / blk.henry[liquid_phase, j] for j in henry_comps
-            )
-        )
-    )
+    return 1 / sum(value(blk.mole_frac_comp[j]) / p_j for j, p_j in p_comp.items())